@@ -1,7 +1,10 @@
 """Data update coordinator for ZControl® integration."""
 
+from dataclasses import asdict, fields
 from datetime import timedelta
+from enum import Enum
 import logging
+from typing import Any
 
 from pyzctrl.devices.basic import ZControlDevice
 from pyzctrl.devices.connection import (
@@ -36,6 +39,7 @@ class ZControlDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval = update_interval,
         )
         self.device = device
+        self.data_version = 0
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -54,10 +58,33 @@ class ZControlDataUpdateCoordinator(DataUpdateCoordinator):
             configuration_url = connection_url,
         )
 
-    async def _async_update_data(self) -> None:
+    @property
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the device's current attributes."""
+        snapshot: dict[str, Any] = {"model": self.device.__class__.MODEL}
+
+        for field in fields(self.device):
+            if field.name == "connection":
+                continue
+            value = getattr(self.device, field.name)
+            if isinstance(value, dict): # components by type (e.g. batteries, pumps)
+                value = {
+                    key.value if isinstance(key, Enum) else key: asdict(component)
+                    for key, component in value.items()
+                }
+            snapshot[field.name] = value
+
+        return snapshot
+
+    async def _async_update_data(self) -> dict[str, Any]:
         """Update device and return its attrributes."""
 
         try:
             await self.hass.async_add_executor_job(self.device.update)
         except ZControlDeviceConnection.ConnectionError as err:
             raise UpdateFailed(f"Error updating device: {err}") from err
+
+        snapshot = self.snapshot
+        if snapshot != self.data:
+            self.data_version += 1
+        return snapshot
@@ -0,0 +1,122 @@
+"""Bulk metrics export for ZControl® integration."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import ZControlDataUpdateCoordinator
+
+FORMAT_JSON = "json"
+FORMAT_PROMETHEUS = "prometheus"
+
+CONTENT_TYPES = {
+    FORMAT_JSON: "application/json",
+    FORMAT_PROMETHEUS: "text/plain; version=0.0.4; charset=utf-8",
+}
+
+# component attributes by the label used to tell components apart
+COMPONENT_LABELS = {
+    "batteries": "battery",
+    "floats": "float",
+    "pumps": "pump",
+}
+
+
+class ZControlMetricsView(HomeAssistantView):
+    """Serve the latest snapshot of every ZControl® device in a single response."""
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the metrics view."""
+        self.hass = hass
+        self.__cache: dict[str, tuple[Any, bytes]] = {}
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return metrics in Prometheus text format, or JSON if requested."""
+        output_format = request.query.get("format", FORMAT_PROMETHEUS)
+        if output_format not in CONTENT_TYPES:
+            return self.json_message(f"Unsupported format '{output_format}'", 400)
+
+        coordinators: dict[str, ZControlDataUpdateCoordinator] = self.hass.data.get(DOMAIN, {})
+        cache_key = tuple(
+            (entry_id, coordinator.data_version, coordinator.last_update_success)
+            for entry_id, coordinator in coordinators.items()
+        )
+
+        cached = self.__cache.get(output_format)
+        if cached is None or cached[0] != cache_key:
+            if output_format == FORMAT_JSON:
+                body = _render_json(coordinators.values())
+            else:
+                body = _render_prometheus(coordinators.values())
+            cached = self.__cache[output_format] = (cache_key, body)
+
+        return web.Response(
+            body = cached[1],
+            headers = {"Content-Type": CONTENT_TYPES[output_format]},
+        )
+
+
+def _render_json(coordinators: [ZControlDataUpdateCoordinator]) -> bytes:
+    devices = [
+        {**(coordinator.data or {}), "available": coordinator.last_update_success}
+        for coordinator in coordinators
+    ]
+    return json.dumps({"devices": devices}).encode()
+
+def _render_prometheus(coordinators: [ZControlDataUpdateCoordinator]) -> bytes:
+    samples: dict[str, list[str]] = {}
+
+    def add_sample(name: str, labels: dict[str, str], value: Any) -> None:
+        if isinstance(value, bool):
+            value = int(value)
+        if not isinstance(value, (int, float)):
+            return
+        samples.setdefault(f"{DOMAIN}_{name}", []).append(
+            f"{DOMAIN}_{name}{_format_labels(labels)} {value}"
+        )
+
+    for coordinator in coordinators:
+        snapshot = coordinator.data or {}
+        labels = {"device_id": coordinator.device.device_id}
+        info = {key: value for key, value in snapshot.items() if isinstance(value, str)}
+
+        add_sample("up", labels, coordinator.last_update_success)
+        add_sample("device_info", {**labels, **info}, 1)
+
+        for key, value in snapshot.items():
+            if key in COMPONENT_LABELS and isinstance(value, dict):
+                label = COMPONENT_LABELS[key]
+                for component_type, attrs in value.items():
+                    for attr, attr_value in attrs.items():
+                        add_sample(
+                            f"{label}_{attr}",
+                            {**labels, label: component_type},
+                            attr_value,
+                        )
+            else:
+                add_sample(key, labels, value)
+
+    lines: [str] = []
+    for name, metric_samples in samples.items():
+        lines.append(f"# TYPE {name} gauge")
+        lines.extend(metric_samples)
+    return ("\n".join(lines) + "\n").encode() if lines else b""
+
+def _format_labels(labels: dict[str, str]) -> str:
+    formatted = ",".join(
+        f'{key}="{_escape_label_value(str(value))}"' for key, value in labels.items()
+    )
+    return f"{{{formatted}}}"
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")